@@ -1,15 +1,139 @@
 import sys
 import os
+import time
 import json
+import re
+import ipaddress
+from urllib.parse import urlsplit
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import ollama
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+
+# selectolax (Lexbor backend) is much faster than BeautifulSoup for the library page
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Prefer the C-based lxml parser; fall back to the pure-Python one if it isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# orjson decodes manifests much faster; stdlib json accepts bytes as well
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Aho-Corasick matches every search keyword in a single pass over each item
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Only advertise brotli when a decoder is installed, otherwise responses can't be decompressed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+# ijson parses the local /api/tags listing straight off the socket
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx with HTTP/2 multiplexes concurrent ollama.com requests over one connection
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+def parse_ollama_host(host):
+    """Normalises an OLLAMA_HOST value to a base URL the same way the official client does."""
+    host, port = (host or '').strip(), 11434
+    scheme, _, hostport = host.partition('://')
+    if not hostport:
+        scheme, hostport = 'http', host
+    elif scheme == 'http':
+        port = 80
+    elif scheme == 'https':
+        port = 443
+
+    split = urlsplit(f'{scheme}://{hostport}')
+    hostname = split.hostname or '127.0.0.1'
+    try:
+        if isinstance(ipaddress.ip_address(hostname), ipaddress.IPv6Address):
+            hostname = f'[{hostname}]'
+    except ValueError:
+        pass
+
+    base = f'{scheme}://{hostname}:{split.port or port}'
+    path = split.path.strip('/')
+    return f'{base}/{path}' if path else base
 
 # Configuration
 
-OLLAMA_HOST = "http://localhost:11434"
+# Same server the ollama client talks to (honours the OLLAMA_HOST environment variable)
+OLLAMA_HOST = parse_ollama_host(os.environ.get('OLLAMA_HOST'))
 MODEL_NAME = "" # Global variable, starts empty
 LIBRARY_URL = "https://ollama.com/search?o=newest"
+LIBRARY_JSON_URL = "https://ollama.com/search?o=newest&format=json"
+STREAM_FLUSH_EVERY = 4 # chat chunks written between stdout flushes
+PULL_REDRAW_INTERVAL = 0.05 # seconds between pull progress redraws
+HTTP_HEADERS = {'User-Agent': 'ollama-cli/1.0', 'Accept-Encoding': ACCEPT_ENCODING}
+
+# requests session for the local Ollama API (and ollama.com when httpx isn't installed)
+SESSION = requests.Session()
+SESSION.headers.update(HTTP_HEADERS)
+
+# Client for ollama.com: an HTTP/2 httpx client when available, otherwise the requests session
+if httpx is not None:
+    CLIENT = httpx.Client(http2=True, timeout=15.0, follow_redirects=True, headers=HTTP_HEADERS)
+    HTTP_ERRORS = (requests.RequestException, httpx.HTTPError)
+else:
+    # Pooled keep-alive connections so repeated library queries reuse the TLS session
+    SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    CLIENT = SESSION
+    HTTP_ERRORS = (requests.RequestException,)
+
+# Library page cache: revalidated with ETag/Last-Modified, reused outright within the TTL
+LIBRARY_CACHE_TTL = 60 # seconds
+# 'json_supported' stays None until the structured feed has been probed once
+_library_cache = {'etag': None, 'last_modified': None, 'items': None, 'ts': 0, 'json_supported': None}
+
+# Byte -> GB/KB factors (multiply instead of dividing per item)
+_GB_INV = 1 / (1 << 30)
+_KB_INV = 1 / 1024
+
+# Known layout of a search result: <li class="... py-6 ..."> ... <h2>NAME</h2> ... [<p>DESC</p>]
+# Tag names end on \b (so <p> never matches <path>, <li> never <link>), and every gap
+# is tempered with (?!</li>) so a match never runs into the next item.
+_IN_ITEM = r"(?:(?!</li>).)*?"
+MODEL_ITEM_PATTERN = re.compile(
+    r"""<li\b[^>]*class=["'][^"']*\bpy-6\b[^"']*["'][^>]*>"""
+    + _IN_ITEM + r"<h2\b[^>]*>(" + _IN_ITEM + r")</h2>"
+    + r"(?:" + _IN_ITEM + r"<p\b[^>]*>(" + _IN_ITEM + r")</p>)?",
+    re.DOTALL,
+)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Only build the DOM for the search result items, not the whole page
+MODEL_ITEM_STRAINER = SoupStrainer('li', class_='py-6')
+
+def human_gb(n):
+    """Formats a byte count as GB with two decimals."""
+    return f"{n * _GB_INV:.2f}"
 
 def print_separator():
     print("=" * 80)
@@ -31,18 +155,142 @@ def confirm_action(action_name):
     confirm = input(f"⚠️  Are you sure you want to {action_name}? (y/N): ")
     return confirm.lower() == 'y'
     
-def fetch_all_remote_data():
-    """Helper to scrape all model entries from the current page."""
+def parse_remote_items(html):
+    """Extracts (name, description) tuples from the library search page."""
+    items = []
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        # Ollama search result items are typically in <li> tags with class 'py-6'
+        for item in tree.css('li.py-6') or tree.css('ul > li'):
+            name_tag = item.css_first('h2') or item.css_first('span.text-lg')
+            desc_tag = item.css_first('p') or item.css_first('span.max-w-md')
+            if name_tag:
+                desc = desc_tag.text(strip=True) if desc_tag else ""
+                items.append((name_tag.text(strip=True), desc))
+        return items
+
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=MODEL_ITEM_STRAINER)
+    model_items = soup.find_all('li', class_='py-6')
+    if not model_items:
+        # Fallback for different site versions needs the full document
+        model_items = BeautifulSoup(html, HTML_PARSER).select('ul > li')
+
+    for item in model_items:
+        name_tag = item.find('h2') or item.find('span', class_='text-lg')
+        desc_tag = item.find('p') or item.find('span', class_='max-w-md')
+        if name_tag:
+            desc = desc_tag.get_text(strip=True) if desc_tag else ""
+            items.append((name_tag.get_text(strip=True), desc))
+    return items
+
+def _strip_tags(fragment):
+    return unescape(TAG_PATTERN.sub('', fragment)).strip()
+
+def parse_remote_items_regex(html):
+    """Extracts (name, description) tuples straight from the page text, without building a DOM."""
+    return [(_strip_tags(name), _strip_tags(desc)) for name, desc in MODEL_ITEM_PATTERN.findall(html)]
+
+def _get_streamed(url, headers=None):
+    """GET on CLIENT that only downloads the body once _read_body() is called."""
+    if CLIENT is SESSION:
+        return SESSION.get(url, headers=headers, timeout=15, stream=True)
+    return CLIENT.send(CLIENT.build_request('GET', url, headers=headers), stream=True)
+
+def _read_body(response):
+    """Downloads a streamed response so .text/.json() work on both clients."""
+    if CLIENT is not SESSION:
+        response.read()
+    return response
+
+def fetch_library_json():
+    """
+    Probes the structured library feed; returns (items, None) when it serves JSON.
+    If the server ignores the format and sends the HTML page instead, returns
+    (None, response) with the body still unread so it can be scraped directly.
+    """
+    if _library_cache['json_supported'] is False:
+        return None, None
+
+    try:
+        response = _get_streamed(LIBRARY_JSON_URL)
+    except HTTP_ERRORS:
+        # Possibly a transient network error: skip the probe for this call only
+        # and let the HTML request report the failure
+        return None, None
+
+    content_type = response.headers.get('Content-Type', '')
+    if response.status_code not in (200, 404, 410):
+        # Server-side hiccup (5xx, rate limit...): try the feed again next time
+        response.close()
+        return None, None
+
+    # Endpoint missing or not structured: stop probing and scrape the HTML page instead
+    _library_cache['json_supported'] = False
+    if response.status_code == 200 and 'html' in content_type:
+        return None, response
+
+    try:
+        if response.status_code == 200 and 'json' in content_type:
+            data = _read_body(response).json()
+            models = data.get('models', []) if isinstance(data, dict) else data
+            items = [(m['name'], m.get('description') or "") for m in models if m.get('name')]
+            if items:
+                _library_cache['json_supported'] = True
+                return items, None
+    except (ValueError, TypeError, AttributeError):
+        pass
+    finally:
+        response.close()
+    return None, None
+
+def with_search_keys(items):
+    """Adds lowercased name/description once per item: (name, desc, name_lower, desc_lower)."""
+    return [(name, desc, name.lower(), desc.lower()) for name, desc in items]
+
+def fetch_library_items():
+    """
+    Returns (name, desc, name_lower, desc_lower) library items,
+    using a conditional GET to revalidate the cached page.
+    """
+    if _library_cache['items'] is not None and time.time() - _library_cache['ts'] < LIBRARY_CACHE_TTL:
+        return _library_cache['items']
+
+    items, response = fetch_library_json()
+    if items is not None:
+        _library_cache.update({'items': with_search_keys(items), 'ts': time.time()})
+        return _library_cache['items']
+
+    # Validators are only meaningful for LIBRARY_URL, not for a probe response reused as the page
+    from_probe = response is not None
+    if not from_probe:
+        headers = {}
+        if _library_cache['etag']:
+            headers['If-None-Match'] = _library_cache['etag']
+        if _library_cache['last_modified']:
+            headers['If-Modified-Since'] = _library_cache['last_modified']
+
+        response = _get_streamed(LIBRARY_URL, headers=headers)
+        if response.status_code == 304 and _library_cache['items'] is not None:
+            # Page unchanged: keep the previously parsed items
+            response.close()
+            _library_cache['ts'] = time.time()
+            return _library_cache['items']
+
     try:
-        response = requests.get(LIBRARY_URL, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Ollama search result items are typically in <li> tags with class 'py-6'
-        return soup.find_all('li', class_='py-6') or soup.select('ul > li')
-    except Exception as e:
-        print(f"❌ Error reaching Ollama website: {e}")
-        return []
+        html = _read_body(response).text
+    finally:
+        response.close()
+    # The regex only knows the current layout; fall back to a DOM parse if it finds nothing
+    items = parse_remote_items_regex(html) or parse_remote_items(html)
+
+    _library_cache.update({
+        'etag': None if from_probe else response.headers.get('ETag'),
+        'last_modified': None if from_probe else response.headers.get('Last-Modified'),
+        'items': with_search_keys(items),
+        'ts': time.time(),
+    })
+    return _library_cache['items']
 
 def list_remote_models():
     """Fetches ALL models from the newest search page and displays them with separators."""
@@ -50,66 +298,63 @@ def list_remote_models():
     print("Please wait, parsing newest models...\n")
     
     try:
-        response = requests.get(LIBRARY_URL, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Select the list items that contain model information
-        # Ollama typically uses <li> tags with specific classes for search results
-        model_items = soup.find_all('li', class_='py-6')
-        
-        if not model_items:
-            # Fallback for different site versions
-            model_items = soup.select('ul > li')
+        model_items = fetch_library_items()
 
         print(f"{'MODEL NAME':<30} | {'FULL DESCRIPTION'}")
         print_separator()
 
-        found_any = False
-        for item in model_items:
-            # Extract Name
-            name_tag = item.find('h2') or item.find('span', class_='text-lg')
-            # Extract Description
-            desc_tag = item.find('p') or item.find('span', class_='max-w-md')
+        for name, description, _, _ in model_items:
+            description = description or "No description provided."
             
-            if name_tag:
-                name = name_tag.get_text(strip=True)
-                description = desc_tag.get_text(strip=True) if desc_tag else "No description provided."
-                
-                # Print with a clear line separator after each
-                print(f"{name:<30} | {description}")
-                print("-" * 80) # Line separator for each model
-                found_any = True
+            # Print with a clear line separator after each
+            print(f"{name:<30} | {description}")
+            print("-" * 80) # Line separator for each model
         
-        if not found_any:
+        if not model_items:
             print("❌ Could not parse any models. The website structure may have changed.")
             
     except Exception as e:
         print(f"❌ Error fetching remote data: {e}")
         
+@lru_cache(maxsize=32)
+def build_matcher(terms):
+    """Returns a function telling whether a string contains any of the search terms (a frozenset)."""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+
+        def contains_term(text):
+            return any(automaton.iter(text))
+    else:
+        def contains_term(text):
+            return any(term in text for term in terms)
+
+    return contains_term
+
 def search_remote_models():
     """Asks user for a string and finds matching models in the remote library."""
-    search_query = input("\n🔎 Enter a model name or keyword to search for (e.g., 'mistral' or 'vision'): ").lower()
+    search_query = input("\n🔎 Enter model names or keywords to search for, comma-separated (e.g., 'mistral' or 'vision, coder'): ").lower()
+    terms = [term.strip() for term in search_query.split(',') if term.strip()]
     
-    if not search_query:
+    if not terms:
         print("Search cancelled (empty query).")
         return
 
     print(f"📡 Searching library for: '{search_query}'...")
-    items = fetch_all_remote_data()
+    try:
+        items = fetch_library_items()
+    except Exception as e:
+        print(f"❌ Error reaching Ollama website: {e}")
+        return
     
     matches = []
-    for item in items:
-        name_tag = item.find('h2') or item.find('span', class_='text-lg')
-        desc_tag = item.find('p') or item.find('span', class_='max-w-md')
-        
-        if name_tag:
-            name = name_tag.get_text(strip=True)
-            desc = desc_tag.get_text(strip=True) if desc_tag else ""
-            
-            # Check if query is in name or description
-            if search_query in name.lower() or search_query in desc.lower():
-                matches.append((name, desc))
+    contains_term = build_matcher(frozenset(terms))
+    for name, desc, name_lower, desc_lower in items:
+        # Check if any keyword is in name or description
+        if contains_term(name_lower) or contains_term(desc_lower):
+            matches.append((name, desc))
 
     if matches:
         print(f"\n✅ Found {len(matches)} matching model(s):")
@@ -121,43 +366,100 @@ def search_remote_models():
     else:
         print(f"❌ No models found matching '{search_query}'.")
 
+def _model_id(m, default=''):
+    """Model name from an ollama response entry; each fallback is only evaluated if needed."""
+    if hasattr(m, 'model') and m.model:
+        return m.model
+    return m.get('model') or m.get('name') or default
+
 def list_installed_models():
-    """Retrieves and displays local models. Returns a list of names."""
+    """Retrieves and displays local models. Returns (list of names, set of names)."""
     print("\n📦 Installed Local Models:")
     try:
-        response = ollama.list()
-        # In the official library, models is a list of objects or dicts
-        models_info = response.get('models', [])
-        
-        if not models_info:
-            return []
-        
         names = []
-        print(f"{'NAME':<30} | {'SIZE (GB)':<10} | {'ID'}")
-        print("-" * 65)
-        
-        for m in models_info:
-            # Safely get the name from various possible key formats
-            name = m.get('name', m.get('model', 'Unknown'))
-            size_gb = m.get('size', 0) / (1024**3)
-            mid = m.get('digest', 'N/A')[:12]
+        for m in iter_local_models():
+            if not names:
+                print(f"{'NAME':<30} | {'SIZE (GB)':<10} | {'ID'}")
+                print("-" * 65)
+            
+            name = m['name']
+            mid = m['digest'][:12]
             
             names.append(name)
-            print(f"{name:<30} | {size_gb:<10.2f} | {mid}")
+            print(f"{name:<30} | {human_gb(m['size']):<10} | {mid}")
             
-        return names
+        return names, set(names)
     except Exception as e:
         print(f"❌ Error listing models: {e}")
-        return []
+        return [], set()
+
+def get_manifest_root():
+    """Determine the root manifest directory (service install first, then manual)."""
+    service_root = "/usr/share/ollama/.ollama/models/manifests/registry.ollama.ai/library"
+    manual_root = os.path.expanduser("~/.ollama/models/manifests/registry.ollama.ai/library")
+    return service_root if os.path.exists(service_root) else manual_root
+
+def iter_local_models():
+    """
+    Yields {'name', 'size', 'digest'} per local model, streaming /api/tags.
+    """
+    with SESSION.get(f"{OLLAMA_HOST}/api/tags", stream=True, timeout=15) as response:
+        response.raise_for_status()
+        if ijson is not None:
+            response.raw.decode_content = True
+            entries = ijson.items(response.raw, 'models.item')
+        else:
+            entries = response.json().get('models', [])
+
+        for m in entries:
+            yield {
+                'name': _model_id(m, 'Unknown'),
+                'size': m.get('size', 0),
+                'digest': m.get('digest') or 'N/A',
+            }
+
+def stream_pull(model_name):
+    """Pulls a model, redrawing the status line only when it changes."""
+    def draw(line):
+        sys.stdout.write('\rStatus: ' + line.ljust(50))
+        sys.stdout.flush()
+
+    last_line = None
+    last_status = None
+    last_draw = 0.0
+    skipped = None # newest throttled line, drawn before moving on so it never goes stale
+    for progress in ollama.pull(model=model_name, stream=True):
+        status = progress.get('status', '') or ''
+        completed = progress.get('completed')
+        total = progress.get('total')
+        line = status
+        if completed and total:
+            line = f"{status} {completed * 100 // total}%"
+
+        now = time.monotonic()
+        if line == last_line:
+            continue
+        # Byte-counter updates within the same status are limited to one redraw per interval,
+        # except the final one (completed == total)
+        if status == last_status and completed and completed != total and now - last_draw < PULL_REDRAW_INTERVAL:
+            skipped = line
+            continue
+
+        if skipped and status != last_status:
+            draw(skipped)
+        skipped = None
+        draw(line)
+        last_line, last_status, last_draw = line, status, now
+
+    if skipped:
+        draw(skipped)
 
 def pull_model():
     model_name = input("Enter the model name to pull (e.g., llama3): ")
     if confirm_action(f"pull '{model_name}'"):
         print(f"📥 Pulling {model_name}...")
         try:
-            for progress in ollama.pull(model=model_name, stream=True):
-                status = progress.get('status', '')
-                print(f"\rStatus: {status: <50}", end="", flush=True)
+            stream_pull(model_name)
             print(f"\n✅ {model_name} ready.")
         except Exception as e:
             print(f"\n❌ Pull failed: {e}")
@@ -171,21 +473,20 @@ def remove_model():
         except Exception as e:
             print(f"❌ Error: {e}")
             
-def ensure_model_exists(model_name):
+def ensure_model_exists(model_name, installed=None):
     """
     Checks if the model exists locally; if not, pulls it from Ollama.
+    `installed` is an optional set of known model names to skip the lookup.
     Returns True if the model is ready.
     """
     print(f"🔍 Checking if '{model_name}' is ready...")
     try:
-        response = ollama.list()
-        models = [getattr(m, 'model', m.get('model', m.get('name', ''))) for m in response.get('models', [])]
+        if installed is None:
+            installed = {m['name'] for m in iter_local_models()}
         
-        if model_name not in models and f"{model_name}:latest" not in models:
+        if model_name not in installed and f"{model_name}:latest" not in installed:
             print(f"📥 Model '{model_name}' not found. Downloading now...")
-            for progress in ollama.pull(model=model_name, stream=True):
-                status = progress.get('status', '')
-                print(f"\rStatus: {status: <50}", end="", flush=True)
+            stream_pull(model_name)
             print(f"\n✅ {model_name} downloaded successfully!")
         else:
             print(f"✅ {model_name} is ready to go.")
@@ -199,7 +500,7 @@ def select_and_run_model():
     global MODEL_NAME
     
     # 1. Get the actual list of installed models
-    installed_names = list_installed_models()
+    installed_names, installed_set = list_installed_models()
     
     # FIX: Check if the list actually has content
     if not installed_names:
@@ -215,23 +516,23 @@ def select_and_run_model():
     # 3. Matching Logic:
     # We check if the input matches exactly OR if the input + ':latest' matches
     matched_model = ""
-    if user_choice in installed_names:
+    if user_choice in installed_set:
         matched_model = user_choice
-    elif f"{user_choice}:latest" in installed_names:
+    elif f"{user_choice}:latest" in installed_set:
         matched_model = f"{user_choice}:latest"
 
     if matched_model:
         # 4. Set global variable and run
         MODEL_NAME = matched_model
         print(f"✅ Selected: {MODEL_NAME}")
-        run_llama()
+        run_llama(installed_set)
     else:
         print(f"❌ Error: '{user_choice}' is not in the installed list.")
 
-def run_llama():
+def run_llama(installed=None):
     """Starts the chat loop with the selected MODEL_NAME and includes a sub-menu."""
     # Ensure model is ready before starting
-    if not ensure_model_exists(MODEL_NAME):
+    if not ensure_model_exists(MODEL_NAME, installed):
         return
 
     print(f"\n--- CHAT STARTED WITH {MODEL_NAME} (Type 'exit' to quit) ---")
@@ -253,11 +554,20 @@ def run_llama():
                 stream=True
             )
 
-            print(f"Llama ({MODEL_NAME}): ", end="", flush=True)
+            out = sys.stdout.write
+            out(f"Llama ({MODEL_NAME}): ")
+            sys.stdout.flush()
+            pending = 0
             for chunk in stream:
                 content = chunk.get('message', {}).get('content', '')
-                print(content, end="", flush=True)
-            print() # New line after model finishes
+                out(content)
+                # Flush at line ends or every few chunks instead of on every token
+                pending += 1
+                if pending >= STREAM_FLUSH_EVERY or content.endswith('\n'):
+                    sys.stdout.flush()
+                    pending = 0
+            out('\n') # New line after model finishes
+            sys.stdout.flush()
             
             # 3. SUB-MENU PROMPT: Pause and ask for the next action
             while True:
@@ -282,8 +592,8 @@ def show_ps():
             print("Memory is clear. No models currently running.")
             return
         for m in running:
-            name = getattr(m, 'model', m.get('model', m.get('name', 'Unknown')))
-            print(f"- {name} (Size: {m['size']/(1024**3):.2f} GB)")
+            name = _model_id(m, 'Unknown')
+            print(f"- {name} (Size: {human_gb(m['size'])} GB)")
     except Exception as e:
         print(f"❌ Error checking ps: {e}")
 
@@ -334,14 +644,25 @@ def show_public_keys():
     except PermissionError:
         print(f"🔒 Permission denied. To read {active_path}, try running with sudo.")
 
+def read_manifest(model_tag, entry):
+    """Worker for list_model_manifests. Returns (model_tag, size_kb, config_sha, path)."""
+    file_size = entry.stat().st_size * _KB_INV
+    
+    # Optional: Read the manifest to show the config SHA256 (the actual model ID)
+    config_sha = None
+    try:
+        with open(entry.path, 'rb') as f:
+            data = json_loads(f.read())
+            config_sha = data.get('config', {}).get('digest', 'Unknown')
+    except:
+        pass
+    return model_tag, file_size, config_sha, entry.path
+
 def list_model_manifests():
     """Lists local manifests, their sizes, and the full paths to their descriptor files."""
     print("\n📄 Model Manifests & Internal Paths:")
     
-    # Determine the root manifest directory
-    service_root = "/usr/share/ollama/.ollama/models/manifests/registry.ollama.ai/library"
-    manual_root = os.path.expanduser("~/.ollama/models/manifests/registry.ollama.ai/library")
-    manifest_root = service_root if os.path.exists(service_root) else manual_root
+    manifest_root = get_manifest_root()
 
     if not os.path.exists(manifest_root):
         print("❌ Manifest directory not found.")
@@ -350,64 +671,80 @@ def list_model_manifests():
     print(f"{'MODEL:TAG':<30} | {'SIZE':<10} | {'FULL MANIFEST PATH'}")
     print("-" * 100)
     
-    for model_dir in os.listdir(manifest_root):
-        model_path = os.path.join(manifest_root, model_dir)
-        if os.path.isdir(model_path):
-            for tag in os.listdir(model_path):
-                file_path = os.path.join(model_path, tag)
-                file_size = os.path.getsize(file_path) / 1024 # KB
-                
-                # Print the model info and the absolute path to the manifest file
-                print(f"{model_dir + ':' + tag:<30} | {file_size:.2f} KB | {file_path}")
-                
-                # Optional: Read the manifest to show the config SHA256 (the actual model ID)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        config_sha = data.get('config', {}).get('digest', 'Unknown')
-                        print(f"   ↳ SHA256 Model ID: {config_sha}")
-                except:
-                    pass
+    # is_dir() is answered from the directory read (d_type); DirEntry.stat() still
+    # makes one stat call, but caches the result after the first call
+    manifests = []
+    with os.scandir(manifest_root) as model_entries:
+        for model_entry in model_entries:
+            if not model_entry.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(model_entry.path) as tag_entries:
+                for tag_entry in tag_entries:
+                    manifests.append((model_entry.name + ':' + tag_entry.name, tag_entry))
+
+    # Manifest reads are independent, so decode them in parallel and print as each finishes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(read_manifest, model_tag, entry) for model_tag, entry in manifests]
+        for future in as_completed(futures):
+            model_tag, file_size, config_sha, file_path = future.result()
+            
+            # Print the model info and the absolute path to the manifest file
+            print(f"{model_tag:<30} | {file_size:.2f} KB | {file_path}")
+            if config_sha:
+                print(f"   ↳ SHA256 Model ID: {config_sha}")
+
+OFFLINE_MENU = """🔴 STATUS: Ollama Service Offline
+   (Ensure 'ollama serve' is running)
+
+1. Retry Connection
+0. Exit
+"""
+
+ONLINE_MENU = """
+🟢 STATUS: Ollama Service Online
+
+1. 💬 Run/CHAT with a specific model
+2. 🌐 List ALL Remote Library Models (Live)
+3. 🔎 Search Remote Library Models
+4. 🖥️ List Installed Local Models
+5. 🚀 Show Running Models (ps)
+6. 📥 Pull a New Model
+7. 🗑️  Remove a Model
+8. 🛑 Stop/Unload a Model
+9. 🔑 Show Ollama Public Keys
+10. 📄 List Manifests & Sizes
+11. 📂 Show Linux File Paths
+0. Exit
+"""
+
+# Menu choice -> action dispatch table ("0" exits and is handled in main)
+ACTIONS = {
+    "1": select_and_run_model,
+    "2": list_remote_models,
+    "3": search_remote_models,
+    "4": list_installed_models,
+    "5": show_ps,
+    "6": pull_model,
+    "7": remove_model,
+    "8": stop_model,
+    "9": show_public_keys,
+    "10": list_model_manifests,
+    "11": list_ollama_paths,
+}
 
 def main():
     while True:
         print_header()
         is_alive = pre_validation()
         
-        if not is_alive:
-            print("🔴 STATUS: Ollama Service Offline")
-            print("   (Ensure 'ollama serve' is running)")
-            print("\n1. Retry Connection")
-            print("0. Exit")
-        else:
-            print("\n🟢 STATUS: Ollama Service Online")
-            print("\n1. 💬 Run/CHAT with a specific model")
-            print("2. 🌐 List ALL Remote Library Models (Live)")
-            print("3. 🔎 Search Remote Library Models")
-            print("4. 🖥️ List Installed Local Models")
-            print("5. 🚀 Show Running Models (ps)")
-            print("6. 📥 Pull a New Model")
-            print("7. 🗑️  Remove a Model")
-            print("8. 🛑 Stop/Unload a Model")
-            print("9. 🔑 Show Ollama Public Keys")
-            print("10. 📄 List Manifests & Sizes")
-            print("11. 📂 Show Linux File Paths")
-            print("0. Exit")
+        sys.stdout.write(ONLINE_MENU if is_alive else OFFLINE_MENU)
 
         choice = input("\nSelect [0-6]: ")
 
         if choice == "0": break
-        elif choice == "1": select_and_run_model()
-        elif choice == "2": list_remote_models()
-        elif choice == "3": search_remote_models()
-        elif choice == "4": list_installed_models()
-        elif choice == "5": show_ps()
-        elif choice == "6": pull_model()
-        elif choice == "7": remove_model()
-        elif choice == "8": stop_model()
-        elif choice == "9": show_public_keys()
-        elif choice == "10": list_model_manifests()
-        elif choice == "11": list_ollama_paths()
+        action = ACTIONS.get(choice)
+        if action:
+            action()
         
         input("\nPress Enter to continue...")
 